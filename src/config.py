@@ -1,11 +1,13 @@
+from functools import lru_cache, wraps
+
 import numpy as np
+import numexpr as ne
 
-import scipy.fftpack
 from scipy.ndimage import gaussian_filter
-from scipy.fft import fft, ifft
+from scipy.fft import rfft, irfft, rfft2, irfft2, set_workers
 
 import matplotlib.pyplot as plt
 from matplotlib.colors import LogNorm
 import cmasher
 
-from typing import Any
\ No newline at end of file
+from typing import Any, Optional
\ No newline at end of file
@@ -1,15 +1,49 @@
 from src.config import *
 
 
-def getRandomStreamFunction(N: int, sigma: float) -> np.ndarray:
+# Number of grid sizes (and precisions) whose spectral multipliers are kept
+# by the lru_caches below. The largest entries hold a full (N, M//2 + 1)
+# array, about 64 MB for N = M = 4096 in float64.
+_CACHE_SIZE = 4
+
+# Above this sigma, getRandomStreamFunction applies its Gaussian filter in
+# spectral space: the direct convolution needs 6*sigma + 1 taps per axis,
+# which then costs more than a forward and inverse 2D FFT.
+_SPECTRAL_FILTER_SIGMA = 8
+
+
+def _allWorkers(func: Any) -> Any:
+    """Run ``func`` with all CPU cores available to ``scipy.fft``.
+
+    Public entry points and CPU implementations are decorated; private
+    helpers inherit their caller's context, and functions with a
+    ``backend`` argument dispatch before entering it.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with set_workers(-1):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+@_allWorkers
+def getRandomStreamFunction(N: int, sigma: float, dtype: Any = np.float64, rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """Generate a random stream function.
 
     The function creates a random field, applies a Gaussian filter, and 
-    normalizes the result to lie in the range [-1, 1].
+    normalizes the result to lie in the range [-1, 1]. Small filters are
+    applied as a direct (periodic) convolution; for wide filters
+    (``sigma > 8``), whose convolution cost grows with ``sigma``, the
+    Gaussian is applied as a multiplication in spectral space instead.
 
     Args:
         N: The size of the square output array (N x N).
         sigma: Standard deviation passed to the Gaussian filter.
+        dtype: Floating point type of the output. The spectral routines keep
+            this precision, so ``np.float32`` halves memory and bandwidth.
+        rng: Random number generator for the white noise. If None, the
+            global ``np.random`` state is used, so ``np.random.seed`` makes
+            the result reproducible.
 
     Returns:
         A NumPy array of shape ``(N, N)`` containing the stream function.
@@ -18,88 +52,327 @@ def getRandomStreamFunction(N: int, sigma: float) -> np.ndarray:
         ValueError: If the maximum of the generated pattern is zero (to avoid
             division by zero during normalization).
     """
-    pattern = gaussian_filter(2 * np.random.rand(N, N) - 1, sigma, mode='wrap')
-    max_val = np.max(np.abs(pattern))
+    if rng is None:
+        noise = np.random.rand(N, N).astype(dtype, copy=False)
+    else:
+        noise = rng.random((N, N), dtype=dtype)
+    noise *= 2
+    noise -= 1
+    if sigma > _SPECTRAL_FILTER_SIGMA:
+        kx, ky, _ = _wavenumbers(N, N, noise.dtype)
+        noise_hat = rfft2(noise)
+        noise_hat *= np.exp(-0.5 * sigma**2 * kx * kx)
+        noise_hat *= np.exp(-0.5 * sigma**2 * ky * ky)
+        pattern = irfft2(noise_hat, s=(N, N), overwrite_x=True)
+    else:
+        pattern = gaussian_filter(noise, sigma, mode='wrap', truncate=3.0)
+    max_val = max(-pattern.min(), pattern.max())
     if max_val == 0:
         raise ValueError("Generated pattern has zero maximum; cannot normalize")
-    psi = pattern / max_val
-    return psi
+    pattern /= max_val
+    return pattern
 
 
-def spectralDeriv(array: np.ndarray) -> np.ndarray:
-    """Compute the spectral derivative of a 1D array using FFT.
+def _realType(array: np.ndarray) -> np.dtype:
+    """Return the floating point type used for the transforms of ``array``.
+
+    Single precision input stays single precision; everything else
+    (including integer input) is promoted to double precision.
+    """
+    return np.result_type(array.dtype, np.float32)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _wavenumbers(N: int, M: int, dtype: np.dtype) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the angular wavenumbers of an ``(N, M)`` real 2D FFT.
+
+    The arrays are shaped to broadcast against the half spectrum returned
+    by ``rfft2`` and are cached per grid size, so they are read-only.
+
+    Args:
+        N: Number of rows (y-direction) of the real-space array.
+        M: Number of columns (x-direction) of the real-space array.
+        dtype: Real floating point type of the wavenumbers, matching the
+            precision of the transformed array.
+
+    Returns:
+        A tuple ``(kx, ky, ky_odd)`` with ``kx`` of shape ``(1, M//2 + 1)``,
+        ``ky`` of shape ``(N, 1)`` and ``ky_odd`` equal to ``ky`` with the
+        Nyquist mode removed, for use in odd-order derivatives.
+    """
+    kx = (2 * np.pi * np.fft.rfftfreq(M)).astype(dtype).reshape(1, -1)
+    ky = (2 * np.pi * np.fft.fftfreq(N)).astype(dtype).reshape(-1, 1)
+    ky_odd = ky.copy()
+    if N % 2 == 0:
+        ky_odd[N // 2] = 0
+    for k in (kx, ky, ky_odd):
+        k.flags.writeable = False
+    return kx, ky, ky_odd
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _rfftWavenumbers(N: int, dtype: np.dtype) -> np.ndarray:
+    """Return the (cached, read-only) angular wavenumbers of a length-``N`` real FFT."""
+    k = (2 * np.pi * np.fft.rfftfreq(N)).astype(dtype)
+    k.flags.writeable = False
+    return k
+
+
+@_allWorkers
+def spectralDeriv(array: np.ndarray, axis: int = -1) -> np.ndarray:
+    """Compute the spectral derivative of an array along one axis using FFT.
 
     This uses the Fourier representation of the derivative: multiply the
-    Fourier coefficients by ``i*k`` and transform back to real space.
+    Fourier coefficients by ``i*k`` and transform back to real space. All
+    1D transforms along ``axis`` are done in one batched real FFT call.
 
     Args:
-        array: 1D real-valued array representing a periodic function.
+        array: Real-valued array that is periodic along ``axis``.
+        axis: Axis along which the derivative is taken.
 
     Returns:
-        A real-valued 1D NumPy array containing the derivative with respect
-        to the array index (assumes unit spacing).
+        A real-valued NumPy array of the same shape as ``array`` containing
+        the derivative with respect to the array index along ``axis``
+        (assumes unit spacing).
     """
-    N = array.shape[0]
-    freqs = np.fft.fftfreq(N, d=1) * 2 * np.pi
-    return np.real(ifft(1j * freqs * fft(array)))
+    axis = axis % array.ndim
+    N = array.shape[axis]
+    k_shape = [1] * array.ndim
+    k_shape[axis] = -1
+    k = _rfftWavenumbers(N, _realType(array)).reshape(k_shape)
+
+    array_hat = rfft(array, axis=axis)
+    array_hat *= 1j * k
+    return irfft(array_hat, n=N, axis=axis, overwrite_x=True)
 
 
-def ddx(array: np.ndarray) -> np.ndarray:
+def ddx(array: np.ndarray, backend: str = "cpu") -> np.ndarray:
     """Compute the derivative along the first axis (rows) of a 2D array.
 
-    The derivative is computed row-by-row using :func:`spectralDeriv`.
+    The derivative of every row is computed at once using
+    :func:`spectralDeriv` along the last axis.
 
     Args:
-        array: 2D real-valued array with shape ``(N, M)``.
+        array: Real-valued array with shape ``(N, M)`` or ``(B, N, M)``.
+        backend: ``"cpu"`` for ``scipy.fft`` or ``"gpu"`` for ``cupy.fft``.
 
     Returns:
-        A 2D NumPy array of the same shape as ``array`` containing the
-        derivative along the x-direction (i.e., derivative of each row).
+        An array of the same shape as ``array`` containing the derivative
+        along the x-direction (i.e., derivative of each row). With the GPU
+        backend this is a CuPy array on the device.
     """
-    deriv = spectralDeriv(array[0]).reshape(1, -1)
-    for slice_ in array[1:]:
-        deriv = np.concatenate([deriv, spectralDeriv(slice_).reshape(1, -1)])
-    return deriv
+    if _useGPU(backend):
+        return _spectralDerivGPU(array, axis=-1)
+    return spectralDeriv(array, axis=-1)
 
 
-def ddy(array: np.ndarray) -> np.ndarray:
+def ddy(array: np.ndarray, backend: str = "cpu") -> np.ndarray:
     """Compute the derivative along the second axis (columns) of a 2D array.
 
-    The computation is performed by transposing the array and applying
-    :func:`spectralDeriv` to each row, then transposing the result back.
+    The derivative of every column is computed at once with a single 2D
+    real FFT: the spectrum is multiplied by ``i*ky`` and transformed back.
+
+    Args:
+        array: Real-valued array with shape ``(N, M)`` or ``(B, N, M)``.
+        backend: ``"cpu"`` for ``scipy.fft`` or ``"gpu"`` for ``cupy.fft``.
+
+    Returns:
+        An array of the same shape as ``array`` containing the derivative
+        along the y-direction (i.e., derivative of each column). With the
+        GPU backend this is a CuPy array on the device.
+    """
+    if _useGPU(backend):
+        return _spectralDerivGPU(array, axis=-2)
+    return _ddyCPU(array)
+
+
+@_allWorkers
+def _ddyCPU(array: np.ndarray) -> np.ndarray:
+    """CPU implementation of :func:`ddy` using ``scipy.fft``."""
+    # A batched 1D transform along the strided y-axis is slower than the
+    # 2D transform, whose first pass runs along contiguous rows
+    shape = array.shape[-2:]
+    _, _, ky = _wavenumbers(*shape, _realType(array))
+    array_hat = rfft2(array)
+    array_hat *= 1j * ky
+    return irfft2(array_hat, s=shape, overwrite_x=True)
+
+
+@_allWorkers
+def getVelocity(psi: np.ndarray) -> np.ndarray:
+    """Compute the velocity field of a stream function as a single stack.
+
+    The velocity components ``vx = dpsi/dy`` and ``vy = -dpsi/dx`` are
+    derived from one forward FFT of ``psi``, and both are transformed back
+    in one batched inverse FFT into a contiguous ``(2, N, N)`` array.
 
     Args:
-        array: 2D real-valued array with shape ``(N, M)``.
+        psi: Stream function array of shape ``(N, N)`` or ``(B, N, N)``.
 
     Returns:
-        A 2D NumPy array of the same shape as ``array`` containing the
-        derivative along the y-direction (i.e., derivative of each column).
+        A NumPy array of shape ``(2,) + psi.shape`` with ``vx`` in ``[0]`` and
+        ``vy`` in ``[1]``, so it can be unpacked as ``vx, vy = getVelocity(psi)``.
     """
-    array_T = array.T
-    deriv = spectralDeriv(array_T[0]).reshape(1, -1)
-    for slice_ in array_T[1:]:
-        deriv = np.concatenate([deriv, spectralDeriv(slice_).reshape(1, -1)])
-    return deriv.T
+    shape = psi.shape[-2:]
+    psi_hat = rfft2(psi)
+    u_hat = _velocitySpectrum(psi_hat, shape)
+    return irfft2(u_hat, s=shape, overwrite_x=True)
+
 
+def _velocitySpectrum(psi_hat: np.ndarray, shape: tuple) -> np.ndarray:
+    """Return the stacked half spectra of ``vx = dpsi/dy`` and ``vy = -dpsi/dx``.
 
+    Args:
+        psi_hat: Half spectrum of the stream function as returned by ``rfft2``.
+        shape: Real-space shape ``(N, M)`` of the last two axes.
+
+    Returns:
+        A complex array of shape ``(2,) + psi_hat.shape``.
+    """
+    kx, _, ky_odd = _wavenumbers(*shape, psi_hat.real.dtype)
+    u_hat = np.empty((2,) + psi_hat.shape, dtype=psi_hat.dtype)
+    np.multiply(psi_hat, 1j * ky_odd, out=u_hat[0])
+    np.multiply(psi_hat, -1j * kx, out=u_hat[1])
+    return u_hat
+
+
+@_allWorkers
 def getVorticity(vx: np.ndarray, vy: np.ndarray) -> np.ndarray:
     """Compute the vorticity field from velocity components.
 
-    The vorticity is defined as ``omega = dv/dx - du/dy`` and is computed
-    spectrally using :func:`ddx` and :func:`ddy`.
+    The vorticity is defined as ``omega = dv/dx - du/dy``. Both derivatives
+    are combined in spectral space, so a single inverse FFT is needed.
 
     Args:
-        vx: x-component of velocity, 2D array of shape ``(N, N)``.
-        vy: y-component of velocity, 2D array of shape ``(N, N)``.
+        vx: x-component of velocity, array of shape ``(N, N)`` or ``(B, N, N)``.
+        vy: y-component of velocity, array of the same shape as ``vx``.
 
     Returns:
-        A 2D NumPy array containing the vorticity field.
+        A NumPy array of the same shape as ``vx`` containing the vorticity
+        field.
     """
-    omega = ddx(vy) - ddy(vx)
+    shape = vx.shape[-2:]
+    kx, _, ky = _wavenumbers(*shape, _realType(vx))
+    omega_hat = rfft2(vy)
+    omega_hat *= 1j * kx
+    vx_hat = rfft2(vx)
+    vx_hat *= 1j * ky
+    omega_hat -= vx_hat
+    omega = irfft2(omega_hat, s=shape, overwrite_x=True)
     return omega
 
 
-def getOkuboWeiss(psi: np.ndarray) -> np.ndarray:
+@_allWorkers
+def getVorticityFromStreamFunction(psi: np.ndarray) -> np.ndarray:
+    """Compute the vorticity field directly from a stream function.
+
+    For velocities derived from the stream function, ``vx = dpsi/dy`` and
+    ``vy = -dpsi/dx``, the vorticity equals ``omega = -laplacian(psi)``.
+    The Nyquist modes are dropped like in :func:`ddx` and :func:`ddy`, so
+    the result equals ``getVorticity(ddy(psi), -ddx(psi))`` while needing a
+    single forward and inverse FFT pair instead of four.
+
+    Note that the notebook uses the opposite convention, ``vx = -dpsi/dy``
+    and ``vy = dpsi/dx``, for which this function returns ``-omega``.
+
+    Args:
+        psi: Stream function array of shape ``(N, N)`` or ``(B, N, N)``.
+
+    Returns:
+        A NumPy array of the same shape as ``psi`` containing the vorticity
+        field.
+    """
+    shape = psi.shape[-2:]
+    psi_hat = rfft2(psi)
+    psi_hat *= _vorticityMultiplier(*shape, _realType(psi))
+    omega = irfft2(psi_hat, s=shape, overwrite_x=True)
+    return omega
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _vorticityMultiplier(N: int, M: int, dtype: np.dtype) -> np.ndarray:
+    """Return the (cached, read-only) spectral multiplier of ``-laplacian(psi)``.
+
+    The multiplier ``kx**2 + ky**2`` is built from first-derivative
+    wavenumbers with the Nyquist mode removed on both axes, matching two
+    successive applications of :func:`ddx` and :func:`ddy`.
+
+    Args:
+        N: Number of rows (y-direction) of the real-space array.
+        M: Number of columns (x-direction) of the real-space array.
+        dtype: Real floating point type of the multiplier.
+
+    Returns:
+        A real array of shape ``(N, M//2 + 1)``.
+    """
+    kx, _, ky_odd = _wavenumbers(N, M, dtype)
+    kx_odd = kx.copy()
+    if M % 2 == 0:
+        kx_odd[0, -1] = 0
+    m = kx_odd * kx_odd + ky_odd * ky_odd
+    m.flags.writeable = False
+    return m
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _secondDerivativeMultipliers(N: int, M: int, dtype: np.dtype) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the (cached, read-only) spectral multipliers of the second derivatives.
+
+    Since ``(i*k)**2 = -k**2`` and ``(i*kx)*(i*ky) = -kx*ky``, the multipliers
+    are real. Only the mixed one needs a full ``(N, M//2 + 1)`` array; the
+    others broadcast as vectors.
+
+    Args:
+        N: Number of rows (y-direction) of the real-space array.
+        M: Number of columns (x-direction) of the real-space array.
+        dtype: Real floating point type of the multipliers.
+
+    Returns:
+        A tuple ``(mxx, myy, mxy)`` with the multipliers of ``psi_xx``,
+        ``psi_yy`` and ``psi_xy``.
+    """
+    kx, ky, ky_odd = _wavenumbers(N, M, dtype)
+    mxx = -(kx * kx)
+    myy = -(ky * ky)
+    mxy = -(kx * ky_odd)
+    if N % 2 == 0 and M % 2 == 0:
+        # Keep the (Nyquist, Nyquist) corner mode in psi_xy, as the full
+        # complex FFT with fftfreq wavenumbers (both -pi there) does
+        mxy[N // 2, -1] = -(ky[N // 2, 0] * ky[N // 2, 0])
+    for m in (mxx, myy, mxy):
+        m.flags.writeable = False
+    return mxx, myy, mxy
+
+
+def _secondDerivatives(psi_hat: np.ndarray, shape: tuple, scratch: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Transform the second derivatives of a stream function back to real space.
+
+    Each derivative is assembled in the same ``scratch`` spectrum with one
+    multiplication by a cached multiplier. ``scratch`` is refilled before
+    every inverse FFT, so the transforms are allowed to overwrite it.
+
+    Args:
+        psi_hat: Half spectrum of the stream function as returned by ``rfft2``.
+        shape: Real-space shape ``(N, M)`` of the last two axes.
+        scratch: Preallocated array with the shape and type of ``psi_hat``.
+
+    Returns:
+        A tuple ``(psi_xx, psi_yy, psi_xy)`` of real-space arrays.
+    """
+    mxx, myy, mxy = _secondDerivativeMultipliers(*shape, psi_hat.real.dtype)
+
+    np.multiply(psi_hat, mxx, out=scratch)
+    psi_xx = irfft2(scratch, s=shape, overwrite_x=True)
+
+    np.multiply(psi_hat, myy, out=scratch)
+    psi_yy = irfft2(scratch, s=shape, overwrite_x=True)
+
+    np.multiply(psi_hat, mxy, out=scratch)
+    psi_xy = irfft2(scratch, s=shape, overwrite_x=True)
+    return psi_xx, psi_yy, psi_xy
+
+
+def getOkuboWeiss(psi: np.ndarray, backend: str = "cpu") -> np.ndarray:
     """Compute the Okubo–Weiss field from a stream function.
 
     The Okubo–Weiss parameter is computed from second derivatives of the
@@ -107,24 +380,141 @@ def getOkuboWeiss(psi: np.ndarray) -> np.ndarray:
 
         Q = psi_xy**2 - psi_xx * psi_yy
 
-    where derivatives are computed in spectral space.
+    where derivatives are computed in spectral space. A stack of stream
+    functions of shape ``(B, N, N)`` is transformed in one batched FFT.
 
     Args:
-        psi: 2D stream function array of shape ``(N, N)``.
+        psi: Stream function array of shape ``(N, N)`` or ``(B, N, N)``.
+        backend: ``"cpu"`` for ``scipy.fft`` or ``"gpu"`` for ``cupy.fft``.
 
     Returns:
-        A 2D NumPy array of shape ``(N, N)`` containing the Okubo–Weiss
-        field.
+        An array of the same shape as ``psi`` containing the Okubo–Weiss
+        field. With the GPU backend this is a CuPy array on the device.
+    """
+    if _useGPU(backend):
+        return _getOkuboWeissGPU(psi)
+    return _getOkuboWeissCPU(psi)
+
+
+@_allWorkers
+def _getOkuboWeissCPU(psi: np.ndarray) -> np.ndarray:
+    """CPU implementation of :func:`getOkuboWeiss` using ``scipy.fft``."""
+    shape = psi.shape[-2:]
+    psi_hat = rfft2(psi)
+    psi_xx, psi_yy, psi_xy = _secondDerivatives(psi_hat, shape, np.empty_like(psi_hat))
+
+    Q = ne.evaluate("psi_xy * psi_xy - psi_xx * psi_yy")
+    return Q
+
+
+@_allWorkers
+def analyzeStreamFunction(psi: np.ndarray) -> dict:
+    """Compute velocities, vorticity and the Okubo–Weiss field from ``psi``.
+
+    All fields are derived from a single forward FFT of the stream function,
+    using the convention ``vx = dpsi/dy`` and ``vy = -dpsi/dx``. Both
+    velocity components share one batched inverse FFT, the vorticity
+    ``omega = -laplacian(psi)`` needs one more and ``Q`` three, with the
+    Nyquist modes treated as in :func:`getVorticityFromStreamFunction` and
+    :func:`getOkuboWeiss`. The returned fields are therefore consistent
+    with ``getVorticity(vx, vy)`` and ``getOkuboWeiss(psi)``.
+
+    Args:
+        psi: Stream function array of shape ``(N, N)`` or ``(B, N, N)``.
+
+    Returns:
+        A dictionary with keys ``"vx"``, ``"vy"``, ``"omega"`` and ``"Q"``,
+        each holding an array of the same shape as ``psi``.
+    """
+    shape = psi.shape[-2:]
+    psi_hat = rfft2(psi)
+    vx, vy = irfft2(_velocitySpectrum(psi_hat, shape), s=shape, overwrite_x=True)
+
+    scratch = np.empty_like(psi_hat)
+    np.multiply(psi_hat, _vorticityMultiplier(*shape, _realType(psi)), out=scratch)
+    omega = irfft2(scratch, s=shape, overwrite_x=True)
+
+    psi_xx, psi_yy, psi_xy = _secondDerivatives(psi_hat, shape, scratch)
+    Q = ne.evaluate("psi_xy * psi_xy - psi_xx * psi_yy")
+    return {"vx": vx, "vy": vy, "omega": omega, "Q": Q}
+
+
+def _useGPU(backend: str) -> bool:
+    """Return whether ``backend`` selects the CuPy implementation.
+
+    Raises:
+        ValueError: If ``backend`` is neither ``"cpu"`` nor ``"gpu"``.
     """
-    N = psi.shape[0]
-    kx = np.fft.fftfreq(N).reshape(-1, 1)
-    ky = np.fft.fftfreq(N).reshape(1, -1)
-    kx, ky = np.meshgrid(kx, ky)
+    if backend not in ("cpu", "gpu"):
+        raise ValueError(f"Unknown backend '{backend}'; expected 'cpu' or 'gpu'")
+    return backend == "gpu"
 
-    psi_hat = scipy.fftpack.fft2(psi)
-    psi_xy = np.real(scipy.fftpack.ifft2((2 * np.pi * 1j * kx) * (2 * np.pi * 1j * ky) * psi_hat))
-    psi_xx = np.real(scipy.fftpack.ifft2((2 * np.pi * 1j * kx)**2 * psi_hat))
-    psi_yy = np.real(scipy.fftpack.ifft2((2 * np.pi * 1j * ky)**2 * psi_hat))
+
+def _cupy() -> Any:
+    """Import CuPy, which is only needed for the GPU backend.
+
+    Raises:
+        ImportError: If CuPy is not installed.
+    """
+    try:
+        import cupy
+    except ImportError as err:
+        raise ImportError("The 'gpu' backend requires CuPy, install a wheel matching your CUDA version, e.g. `pip install cupy-cuda12x`") from err
+    return cupy
+
+
+def _spectralDerivGPU(array: Any, axis: int) -> Any:
+    """GPU version of :func:`spectralDeriv` using ``cupy.fft``.
+
+    cuFFT plans are kept in CuPy's plan cache, so repeated calls on the
+    same grid size do not pay for planning again.
+    """
+    cp = _cupy()
+    array = cp.asarray(array)
+    N = array.shape[axis]
+    k_shape = [1] * array.ndim
+    k_shape[axis] = -1
+    k = _rfftWavenumbersGPU(N, _realType(array)).reshape(k_shape)
+
+    array_hat = cp.fft.rfft(array, axis=axis)
+    array_hat *= 1j * k
+    return cp.fft.irfft(array_hat, n=N, axis=axis)
+
+
+def _getOkuboWeissGPU(psi: Any) -> Any:
+    """GPU version of :func:`getOkuboWeiss` using ``cupy.fft``.
+
+    A ``(B, N, N)`` stack is transformed in one batched cuFFT call.
+    """
+    cp = _cupy()
+    psi = cp.asarray(psi)
+    shape = psi.shape[-2:]
+    mxx, myy, mxy = _secondDerivativeMultipliersGPU(*shape, _realType(psi))
+
+    psi_hat = cp.fft.rfft2(psi)
+    scratch = cp.empty_like(psi_hat)
+
+    cp.multiply(psi_hat, mxx, out=scratch)
+    psi_xx = cp.fft.irfft2(scratch, s=shape)
+
+    cp.multiply(psi_hat, myy, out=scratch)
+    psi_yy = cp.fft.irfft2(scratch, s=shape)
+
+    cp.multiply(psi_hat, mxy, out=scratch)
+    psi_xy = cp.fft.irfft2(scratch, s=shape)
 
     Q = psi_xy * psi_xy - psi_xx * psi_yy
     return Q
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _rfftWavenumbersGPU(N: int, dtype: np.dtype) -> Any:
+    """Return :func:`_rfftWavenumbers` copied once to the GPU."""
+    return _cupy().asarray(_rfftWavenumbers(N, dtype))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _secondDerivativeMultipliersGPU(N: int, M: int, dtype: np.dtype) -> tuple[Any, Any, Any]:
+    """Return :func:`_secondDerivativeMultipliers` copied once to the GPU."""
+    cp = _cupy()
+    return tuple(cp.asarray(m) for m in _secondDerivativeMultipliers(N, M, dtype))
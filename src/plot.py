@@ -93,7 +93,7 @@ def plotVelocityfields(vx: np.ndarray, vy: np.ndarray, figsize: float, dpi: int)
     cbar_vy.set_label(r"$v$", rotation=0, size=12)
     
     # Plot absolute velocity
-    abs_vel = np.sqrt(vx**2 + vy**2)
+    abs_vel = np.hypot(vx, vy)
     im_abs = axes[2].imshow(abs_vel, cmap=cmasher.ocean, origin='lower', vmin=0)
     axes[2].set_title(r"Absolute amplitude")
     axes[2].set_xlabel(r"$x$")
@@ -120,7 +120,7 @@ def plotVorticity(vx: np.ndarray, vy: np.ndarray, omega: np.ndarray, figsize: fl
         None
     """
     fig, ax = plt.subplots(1, 1, figsize=(figsize, figsize), dpi=dpi)
-    y, x = np.mgrid[0:vx.shape[0], 0:vx.shape[1]]
+    y, x = np.arange(vx.shape[0]), np.arange(vx.shape[1])
 
     r = np.max([-np.min(omega), np.max(omega)])
     im = ax.imshow(omega, origin='lower', cmap=cmasher.prinsenvlag, vmin=-r, vmax=r)
@@ -158,7 +158,7 @@ def plotOkuboWeissField(Q: np.ndarray, vx: np.ndarray, vy: np.ndarray, figsize:
     """
     fig, axes = plt.subplots(1, 2, figsize=(figsize * 2, figsize), dpi=dpi)
     fig.suptitle(r"Okubo-Weiss field $Q(x,y)$", fontsize=14)
-    y, x = np.mgrid[0:vy.shape[0], 0:vy.shape[1]]
+    y, x = np.arange(vy.shape[0]), np.arange(vy.shape[1])
     
     # Left plot: Vorticity-dominated regions (Q < 0)
     axes[0].streamplot(
@@ -223,10 +223,14 @@ def plotNumericalChecks(psi: np.ndarray, vx: np.ndarray, vy: np.ndarray, figsize
         None
     """
     # Continuity check
-    continuity = np.abs(ddx(vx) + ddy(vy)) + 1e-15
+    dvx = ddx(vx)
+    dvy = ddy(vy)
+    continuity = ne.evaluate("abs(dvx + dvy) + 1e-15")
     # Stream function checks
-    A = np.abs(vx * ddx(psi) + vy * ddy(psi)) + 1e-15
-    B = np.abs(vx**2 + vy**2 - ddx(psi)**2 - ddy(psi)**2) + 1e-15
+    px = ddx(psi)
+    py = ddy(psi)
+    A = ne.evaluate("abs(vx * px + vy * py) + 1e-15")
+    B = ne.evaluate("abs(vx * vx + vy * vy - px * px - py * py) + 1e-15")
     
     fig, axes = plt.subplots(1, 3, figsize=(figsize * 3, figsize), dpi=dpi)
     fig.suptitle(r"Numerical Checks", fontsize=14)
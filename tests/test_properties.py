@@ -1,10 +1,41 @@
 import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import matplotlib
+matplotlib.use("Agg")
 
 from src.config import *
 from src.functions import *
 from src.plot import plotNumericalChecks
 
 
+class TestRandomStreamFunction(unittest.TestCase):
+
+    def test_random_stream_function_normalized(self):
+        """Test that both the direct and the spectral Gaussian filter give a normalized field."""
+        N = 64
+        for sigma in [1.0, 12.0]:
+            psi = getRandomStreamFunction(N, sigma)
+
+            self.assertEqual(psi.shape, (N, N))
+            self.assertAlmostEqual(np.max(np.abs(psi)), 1.0, msg=f"Stream function should be normalized for sigma={sigma}")
+
+    def test_random_stream_function_reproducible(self):
+        """Test that seeding the global state or passing a generator makes the stream function reproducible."""
+        N = 32
+        for sigma in [1.0, 12.0]:
+            np.random.seed(0)
+            psi_1 = getRandomStreamFunction(N, sigma)
+            np.random.seed(0)
+            psi_2 = getRandomStreamFunction(N, sigma)
+            psi_3 = getRandomStreamFunction(N, sigma, rng=np.random.default_rng(1))
+            psi_4 = getRandomStreamFunction(N, sigma, rng=np.random.default_rng(1))
+
+            np.testing.assert_array_equal(psi_1, psi_2)
+            np.testing.assert_array_equal(psi_3, psi_4)
+
+
 class TestContinuity(unittest.TestCase):
     
     def test_continuity_random_velocities_false(self):
@@ -31,6 +62,22 @@ class TestContinuity(unittest.TestCase):
         
         # For velocities from stream function, divergence should be very small (numerical precision)
         self.assertLess(max_divergence, 1e-10, "Divergence should be close to zero for stream function derived velocities")
+
+    def test_continuity_from_stream_function_float32(self):
+        """Test that a single precision stream function stays single precision and satisfies continuity."""
+        N = 32
+        sigma = 1.0
+        psi = getRandomStreamFunction(N, sigma, dtype=np.float32)
+
+        vx = ddy(psi)
+        vy = -ddx(psi)
+
+        divergence = ddx(vx) + ddy(vy)
+        max_divergence = np.max(np.abs(divergence))
+
+        self.assertEqual(divergence.dtype, np.float32)
+        self.assertEqual(getOkuboWeiss(psi).dtype, np.float32)
+        self.assertLess(max_divergence, 1e-5, "Divergence should be close to zero for single precision stream function derived velocities")
     
 
 class TestNumericalChecks(unittest.TestCase):
@@ -74,12 +121,137 @@ class TestNumericalChecks(unittest.TestCase):
     def test_plotNumericalChecks_runs(self):
         """Test that plotNumericalChecks runs without errors."""
         N = 10
+        for dtype in [np.float64, np.float32]:
+            psi = getRandomStreamFunction(N, 1.0, dtype=dtype)
+            vx = np.random.rand(N, N).astype(dtype)
+            vy = np.random.rand(N, N).astype(dtype)
+
+            # This should not raise an exception
+            plotNumericalChecks(psi, vx, vy, figsize=3, dpi=50)
+            plt.close("all")
+
+
+class TestOkuboWeiss(unittest.TestCase):
+
+    def test_okubo_weiss_analytic_stream_function(self):
+        """Test the Okubo-Weiss field against the analytic result for a cellular flow."""
+        N = 32
+        y, x = np.mgrid[0:N, 0:N]
+        a = 2 * np.pi * 2 / N
+        b = 2 * np.pi * 3 / N
+        psi = np.sin(a * x) * np.sin(b * y)
+
+        Q_expected = (a * b)**2 * (np.cos(a * x)**2 * np.cos(b * y)**2 - np.sin(a * x)**2 * np.sin(b * y)**2)
+        max_difference = np.max(np.abs(getOkuboWeiss(psi) - Q_expected))
+
+        self.assertLess(max_difference, 1e-10, "Okubo-Weiss field should match the analytic result")
+
+    def test_okubo_weiss_batch_matches_single(self):
+        """Test that a stack of stream functions gives the same result as separate calls."""
+        N = 32
+        psi_stack = np.stack([getRandomStreamFunction(N, 2.0) for _ in range(3)])
+
+        Q_batch = getOkuboWeiss(psi_stack)
+        Q_single = np.stack([getOkuboWeiss(psi) for psi in psi_stack])
+
+        self.assertEqual(Q_batch.shape, psi_stack.shape)
+        self.assertLess(np.max(np.abs(Q_batch - Q_single)), 1e-12, "Batched Okubo-Weiss field should match separate calls")
+
+    def test_okubo_weiss_matches_complex_fft(self):
+        """Test that the real FFT implementation matches the full complex FFT formula, including the Nyquist modes."""
+        for N in [16, 17]:
+            psi = np.random.rand(N, N) - 0.5
+            k = 2 * np.pi * np.fft.fftfreq(N)
+            kx, ky = np.meshgrid(k, k)
+
+            psi_hat = np.fft.fft2(psi)
+            psi_xy = np.real(np.fft.ifft2(-kx * ky * psi_hat))
+            psi_xx = np.real(np.fft.ifft2(-kx * kx * psi_hat))
+            psi_yy = np.real(np.fft.ifft2(-ky * ky * psi_hat))
+            Q_expected = psi_xy * psi_xy - psi_xx * psi_yy
+
+            max_difference = np.max(np.abs(getOkuboWeiss(psi) - Q_expected))
+
+            self.assertLess(max_difference, 1e-10, f"Okubo-Weiss field should match the complex FFT formula for N={N}")
+
+    def test_okubo_weiss_unknown_backend_raises(self):
+        """Test that an unknown backend name is rejected."""
+        psi = getRandomStreamFunction(16, 1.0)
+
+        with self.assertRaises(ValueError):
+            getOkuboWeiss(psi, backend="tpu")
+
+
+class TestAnalyzeStreamFunction(unittest.TestCase):
+
+    def test_analyze_matches_separate_functions(self):
+        """Test that the fused analysis matches the separately computed fields."""
+        for N in [32, 33]:
+            psi = getRandomStreamFunction(N, 1.0)
+
+            fields = analyzeStreamFunction(psi)
+            vx = ddy(psi)
+            vy = -ddx(psi)
+
+            self.assertLess(np.max(np.abs(fields["vx"] - vx)), 1e-10, "vx should match ddy(psi)")
+            self.assertLess(np.max(np.abs(fields["vy"] - vy)), 1e-10, "vy should match -ddx(psi)")
+            self.assertLess(np.max(np.abs(fields["omega"] - getVorticity(fields["vx"], fields["vy"]))), 1e-10, "omega should match getVorticity of the returned velocities")
+            self.assertLess(np.max(np.abs(fields["Q"] - getOkuboWeiss(psi))), 1e-10, "Q should match getOkuboWeiss")
+
+
+class TestVelocity(unittest.TestCase):
+
+    def test_velocity_stack_matches_derivatives(self):
+        """Test that the stacked velocity field matches the separately computed components."""
+        N = 32
         psi = getRandomStreamFunction(N, 1.0)
-        vx = np.random.rand(N, N)
-        vy = np.random.rand(N, N)
-        
-        # This should not raise an exception
-        plotNumericalChecks(psi, vx, vy)
+
+        vx, vy = getVelocity(psi)
+
+        self.assertLess(np.max(np.abs(vx - ddy(psi))), 1e-10, "vx should match ddy(psi)")
+        self.assertLess(np.max(np.abs(vy + ddx(psi))), 1e-10, "vy should match -ddx(psi)")
+
+    def test_velocity_batch_matches_single(self):
+        """Test that a stack of stream functions gives the same velocities and vorticity as separate calls."""
+        N = 32
+        psi_stack = np.stack([getRandomStreamFunction(N, 2.0) for _ in range(3)])
+
+        u_batch = getVelocity(psi_stack)
+        u_single = np.stack([getVelocity(psi) for psi in psi_stack], axis=1)
+        omega_batch = getVorticity(u_batch[0], u_batch[1])
+        omega_single = np.stack([getVorticityFromStreamFunction(psi) for psi in psi_stack])
+
+        self.assertEqual(u_batch.shape, (2,) + psi_stack.shape)
+        self.assertLess(np.max(np.abs(u_batch - u_single)), 1e-12, "Batched velocities should match separate calls")
+        self.assertLess(np.max(np.abs(omega_batch - omega_single)), 1e-10, "Batched vorticity should match separate calls")
+
+
+class TestVorticityFromStreamFunction(unittest.TestCase):
+
+    def test_vorticity_from_stream_function_matches_velocities(self):
+        """Test that the Laplacian vorticity matches the vorticity of the derived velocities."""
+        for N in [32, 33]:
+            psi = getRandomStreamFunction(N, 1.0)
+
+            omega = getVorticityFromStreamFunction(psi)
+            omega_expected = getVorticity(ddy(psi), -ddx(psi))
+
+            self.assertLess(np.max(np.abs(omega - omega_expected)), 1e-10, f"Vorticity from psi should match getVorticity for N={N}")
+
+
+class TestGPUBackend(unittest.TestCase):
+
+    def test_gpu_backend_matches_cpu(self):
+        """Test the GPU code path against the CPU one, with NumPy standing in for CuPy."""
+        fake_cupy = SimpleNamespace(asarray=np.asarray, empty_like=np.empty_like, multiply=np.multiply, fft=np.fft)
+        psi = getRandomStreamFunction(32, 1.0)
+        psi_stack = np.stack([getRandomStreamFunction(32, 2.0) for _ in range(2)])
+
+        with mock.patch("src.functions._cupy", return_value=fake_cupy):
+            for array in [psi, psi_stack]:
+                self.assertLess(np.max(np.abs(ddx(array, backend="gpu") - ddx(array))), 1e-12, "GPU ddx should match the CPU")
+                self.assertLess(np.max(np.abs(ddy(array, backend="gpu") - ddy(array))), 1e-12, "GPU ddy should match the CPU")
+                self.assertLess(np.max(np.abs(getOkuboWeiss(array, backend="gpu") - getOkuboWeiss(array))), 1e-12, "GPU Okubo-Weiss field should match the CPU")
 
 
 if __name__ == '__main__':